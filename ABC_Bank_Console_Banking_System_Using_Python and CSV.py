@@ -1,6 +1,12 @@
+import atexit
 import csv
+import hmac
+import io
+import mmap
 import os
-from datetime import datetime
+import pickle
+import sys
+import time
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from pathlib import Path
 
@@ -8,6 +14,52 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 USERS_FILE = BASE_DIR / "users.csv"
 TRANSACTIONS_FILE = BASE_DIR / "transactions.csv"
+# Snapshot of _USERS and _TX_OFFSETS so the CSV files do not need parsing on
+# startup. The CSV files stay the source of truth; this is only a cache.
+STATE_FILE = BASE_DIR / "state.pkl"
+# Created once both CSV headers have been checked; rename it when the columns change.
+SCHEMA_SENTINEL = BASE_DIR / ".schema_v1"
+
+# Column positions in users.csv and transactions.csv rows.
+_U_USER, _U_PASS, _U_BAL = range(3)
+_T_USER, _T_DATE, _T_TYPE, _T_AMT, _T_BAL, _T_DET = range(6)
+
+# In-memory copy of users.csv: {username: {"password": str, "balance": int cents,
+# "balance_offset": int}}. Loaded once at startup; the CSV is kept in sync on every write.
+_USERS: dict[str, dict] = {}
+
+# Balances are stored zero-padded to a fixed width so a single balance can be
+# overwritten in place at its byte offset instead of rewriting the whole file.
+_BALANCE_WIDTH = 14
+# Largest balance, in cents, that fits in that width (99999999999.99).
+_MAX_BALANCE = 10 ** (_BALANCE_WIDTH - 1) - 1
+
+# Byte offset of every row in transactions.csv, grouped by username. Rows that
+# another running instance appends are not added here until the next rebuild.
+_TX_OFFSETS: dict[str, list[int]] = {}
+
+# Files kept open for the whole session (opened in initialize_files). Both are
+# unbuffered: users.csv only gets single balance writes, and each operation
+# appends its transaction rows with one write in _write_transactions.
+_USERS_FH = None
+_TX_FH = None
+# Read-only map of transactions.csv used by transaction_history (see _tx_map).
+_TX_MM = None
+
+# Signature of the CSV files as this session last left them (see _files_signature).
+# If the files change behind our back, the snapshot is not saved on exit.
+_STATE_SIGNATURE = None
+
+# Buffer size for reads that scan a whole file.
+_SCAN_BUFFER = 1 << 20
+
+# Last formatted transaction timestamp and the second it was made for.
+_TS_SEC = -1
+_TS_TEXT = ""
+
+# Scratch buffer used to turn a row into CSV-escaped bytes.
+_ROW_BUFFER = io.StringIO()
+_ROW_WRITER = csv.writer(_ROW_BUFFER)
 
 # Initialize the files
 def _ensure_headers(file_path: Path, headers: list[str]):
@@ -17,12 +69,14 @@ def _ensure_headers(file_path: Path, headers: list[str]):
             csv.writer(f).writerow(headers)
         return
 
-    # If headers are missing or wrong, rewrite them and keep existing rows.
+    # Usually the header is already right, so only read the first row.
     with file_path.open(mode="r", newline="", encoding="utf-8") as f:
-        rows = list(csv.reader(f))
+        if next(csv.reader(f), None) == headers:
+            return
 
-    if rows and rows[0] == headers:
-        return
+    # If headers are missing or wrong, rewrite them and keep existing rows.
+    with file_path.open(mode="r", newline="", encoding="utf-8", buffering=_SCAN_BUFFER) as f:
+        rows = list(csv.reader(f))
 
     with file_path.open(mode="w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
@@ -36,29 +90,237 @@ def _ensure_headers(file_path: Path, headers: list[str]):
 
 def initialize_files():
     "Create necessary CSV files with headers if they don't exist."
-    _ensure_headers(USERS_FILE, ["username", "password", "balance"])
-    _ensure_headers(TRANSACTIONS_FILE, ["username", "date", "type", "amount", "balance", "details"])
+    if not (SCHEMA_SENTINEL.exists() and _has_data(USERS_FILE) and _has_data(TRANSACTIONS_FILE)):
+        _ensure_headers(USERS_FILE, ["username", "password", "balance"])
+        _ensure_headers(TRANSACTIONS_FILE, ["username", "date", "type", "amount", "balance", "details"])
+        SCHEMA_SENTINEL.touch()
+    global _STATE_SIGNATURE
+    if not _load_state():
+        _load_users()
+        _scan_tx_offsets()
+    _STATE_SIGNATURE = _files_signature()
+    _open_files()
+
+
+def _has_data(file_path: Path) -> bool:
+    """True if the file exists and is not empty."""
+    try:
+        return file_path.stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _open_files():
+    """Open users.csv and transactions.csv once for the rest of the session."""
+    global _USERS_FH, _TX_FH
+    _USERS_FH = USERS_FILE.open(mode="r+b", buffering=0)
+    _TX_FH = TRANSACTIONS_FILE.open(mode="ab", buffering=0)
+    atexit.register(_close_files)
+
+
+def _close_files():
+    """Flush and close the session files, then save the in-memory state."""
+    _USERS_FH.close()
+    _TX_FH.close()
+    if _TX_MM is not None:
+        _TX_MM.close()
+    if _files_signature() == _STATE_SIGNATURE:
+        _save_state()
+    else:
+        # Someone else changed the files; the next start must rebuild from CSV.
+        STATE_FILE.unlink(missing_ok=True)
+
+
+def _files_signature() -> tuple:
+    """Size and mtime of both CSV files, used to tell if a saved snapshot is stale."""
+    users, transactions = USERS_FILE.stat(), TRANSACTIONS_FILE.stat()
+    return users.st_size, users.st_mtime_ns, transactions.st_size, transactions.st_mtime_ns
+
+
+def _load_state() -> bool:
+    """Load _USERS and _TX_OFFSETS from the snapshot.
+    Returns False if it is missing or the CSV files changed since it was saved."""
+    try:
+        with STATE_FILE.open(mode="rb") as f:
+            saved = pickle.load(f)
+        if saved["signature"] != _files_signature():
+            return False
+        users, offsets = saved["users"], saved["tx_offsets"]
+    except Exception:
+        # Any unreadable snapshot just means rebuilding from the CSV files.
+        return False
+    if not _valid_state(users, offsets):
+        return False
+    _USERS.clear()
+    _USERS.update(users)
+    _TX_OFFSETS.clear()
+    _TX_OFFSETS.update(offsets)
+    return True
+
+
+def _valid_state(users, offsets) -> bool:
+    """Check a loaded snapshot has the shape _USERS and _TX_OFFSETS expect."""
+    if not isinstance(users, dict) or not isinstance(offsets, dict):
+        return False
+    return all(
+        isinstance(entry, dict) and {"password", "balance", "balance_offset"} <= entry.keys()
+        for entry in users.values()
+    ) and all(isinstance(rows, list) for rows in offsets.values())
+
+
+def _scan_tx_offsets():
+    """Build _TX_OFFSETS with one pass over transactions.csv."""
+    _TX_OFFSETS.clear()
+    with TRANSACTIONS_FILE.open(mode="rb", buffering=_SCAN_BUFFER) as f:
+        _advise_sequential(f)
+        offset = len(f.readline())  # skip header
+        for line in f:
+            row = _split_line(line.decode("utf-8"))
+            if row:
+                _TX_OFFSETS.setdefault(row[_T_USER], []).append(offset)
+            offset += len(line)
+
+
+def _advise_sequential(f):
+    """Tell the OS a file will be read front to back so it reads ahead (Linux only)."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _save_state():
+    state = {"signature": _files_signature(), "users": _USERS, "tx_offsets": _TX_OFFSETS}
+    # Write to a temporary file first so an interrupted exit can't leave a half-written snapshot.
+    tmp_path = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    with tmp_path.open(mode="wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def _flush_files():
+    """Push everything written by the current operation to the OS."""
+    global _STATE_SIGNATURE
+    _TX_FH.flush()
+    _USERS_FH.flush()
+    _STATE_SIGNATURE = _files_signature()
+
+
+def _tx_map() -> mmap.mmap | None:
+    """Map transactions.csv, remapping if rows were appended since the last map.
+    Returns None if the file is empty, since an empty file cannot be mapped."""
+    global _TX_MM
+    size = os.fstat(_TX_FH.fileno()).st_size
+    if size == 0:
+        return None
+    if _TX_MM is None or len(_TX_MM) < size:
+        if _TX_MM is not None:
+            _TX_MM.close()
+        with TRANSACTIONS_FILE.open(mode="rb") as f:
+            _TX_MM = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _TX_MM
+
+
+def _csv_line(row: list[str]) -> bytes:
+    """Encode one row exactly as csv.writer would write it."""
+    _ROW_BUFFER.seek(0)
+    _ROW_BUFFER.truncate()
+    _ROW_WRITER.writerow(row)
+    return _ROW_BUFFER.getvalue().encode("utf-8")
+
+
+def _split_line(line: str) -> list[str]:
+    """Split one CSV line into fields.
+    csv.writer quotes every field that holds a comma or quote, so a line
+    without quotes can be split on commas directly."""
+    line = line.rstrip("\r\n")
+    if '"' in line:
+        return next(csv.reader([line]), [])
+    return line.split(",") if line else []
+
+
+def _load_users():
+    """Read users.csv once into the in-memory index."""
+    if not _read_users():
+        # Older files store balances unpadded; convert them once.
+        _rewrite_users()
+        _read_users()
+
+
+def _read_users() -> bool:
+    """Fill _USERS from users.csv, recording where each balance field starts.
+    Returns False if the file is not in fixed-width balance format."""
+    _USERS.clear()
+    fixed_width = True
+    with USERS_FILE.open(mode="rb", buffering=_SCAN_BUFFER) as f:
+        _advise_sequential(f)
+        offset = len(f.readline())  # skip header
+        for line in f:
+            record = line.rstrip(b"\r\n")
+            row = _split_line(record.decode("utf-8"))
+            if len(row) >= 3:
+                _USERS[row[_U_USER]] = {
+                    "password": row[_U_PASS],
+                    "balance": _parse_cents(row[_U_BAL]),
+                    "balance_offset": offset + len(record) - _BALANCE_WIDTH,
+                }
+                if len(row[_U_BAL]) != _BALANCE_WIDTH or not record.endswith(row[_U_BAL].encode("utf-8")):
+                    fixed_width = False
+            if not line.endswith(b"\n"):
+                fixed_width = False
+            offset += len(line)
+    return fixed_width
+
+
+def _rewrite_users():
+    """Write every user from the in-memory index back to users.csv."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["username", "password", "balance"])
+    writer.writerows(
+        (username, entry["password"], _balance_field(entry["balance"]))
+        for username, entry in _USERS.items()
+    )
+    USERS_FILE.write_bytes(buf.getvalue().encode("utf-8"))
+
+
+def _balance_field(cents: int) -> str:
+    """Format a balance the way it is stored in users.csv."""
+    return _format_cents(cents).zfill(_BALANCE_WIDTH)
+
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0.00")
 
 def _normalize_decimal(value: Decimal) -> Decimal:
     """Keep money values at 2 decimal places. Falls back to 0.00 on invalid."""
     try:
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return value.quantize(_CENT, rounding=ROUND_HALF_UP)
     except InvalidOperation:
-        return Decimal("0.00")
+        return _ZERO
+
+
+# Money is kept as integer cents; Decimal is only used to parse text.
+def _parse_cents(text: str) -> int:
+    """Convert a stored amount like "12.34" to cents. Falls back to 0 on invalid."""
+    try:
+        return int(_normalize_decimal(Decimal(text)) * 100)
+    except (InvalidOperation, ValueError):
+        return 0
+
+
+def _format_cents(cents: int) -> str:
+    """Format cents as a plain amount like "12.34"."""
+    sign = "-" if cents < 0 else ""
+    units, rest = divmod(abs(cents), 100)
+    return f"{sign}{units}.{rest:02d}"
 
 
 # User Creation and Login
 def user_exists(username: str) -> bool:
-    if not USERS_FILE.exists():
-        return False
-    with USERS_FILE.open(mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return any(row["username"] == username for row in reader)
+    return username in _USERS
 
 #User Registration
 def register():
     print("\n=== Register ===")
-    username = input("Choose a username: ").strip()
+    username = _input("Choose a username: ").strip()
     if not username:
         print("Username cannot be empty.")
         return
@@ -67,70 +329,108 @@ def register():
         print("Username already exists. Please choose another.")
         return
 
-    password = input("Choose a password: ").strip()
+    password = _input("Choose a password: ").strip()
     if not password:
         print("Password cannot be empty.")
         return
 
-    with USERS_FILE.open(mode="a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([username, password, "0.00"])
+    line = _csv_line([username, password, _balance_field(0)])
+    start = _USERS_FH.seek(0, os.SEEK_END)
+    _USERS_FH.write(line)
+    _USERS[username] = {
+        "password": password,
+        "balance": 0,
+        "balance_offset": start + len(line.rstrip(b"\r\n")) - _BALANCE_WIDTH,
+    }
+    _flush_files()
     print(f"Account created for {username}. You can now log in.")
 
 def login():
     print("\n=== Login ===")
-    username = input("Username: ").strip()
-    password = input("Password: ").strip()
-    with USERS_FILE.open(mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["username"] == username and row["password"] == password:
-                print(f"Welcome back, {username}!")
-                return username
+    username = _input("Username: ").strip()
+    password = _input("Password: ").strip()
+    entry = _USERS.get(username)
+    if entry is not None and hmac.compare_digest(entry["password"].encode("utf-8"), password.encode("utf-8")):
+        print(f"Welcome back, {username}!")
+        return username
     print("Invalid credentials. Please try again.")
     return None
 
 # Balance Check and Update
-def get_balance(username: str) -> Decimal:
-    with USERS_FILE.open(mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["username"] == username:
-                try:
-                    return _normalize_decimal(Decimal(row["balance"]))
-                except InvalidOperation:
-                    return Decimal("0.00")
-    return Decimal("0.00")
+def get_balance(username: str) -> int:
+    entry = _USERS.get(username)
+    if entry is None:
+        return 0
+    return entry["balance"]
 
 #Update balance
-def update_balance(username: str, new_balance: Decimal):
-    new_balance = _normalize_decimal(new_balance)
-    rows = []
-    with USERS_FILE.open(mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    with USERS_FILE.open(mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["username", "password", "balance"])
-        writer.writeheader()
-        for row in rows:
-            if row["username"] == username:
-                row["balance"] = f"{new_balance:.2f}"
-            writer.writerow(row)
+def update_balance(username: str, new_balance: int):
+    entry = _USERS.get(username)
+    if entry is None:
+        return
+    field = _balance_field(new_balance)
+    if len(field) != _BALANCE_WIDTH:
+        raise ValueError("Balance exceeds the maximum that can be stored.")
+
+    _USERS_FH.seek(entry["balance_offset"])
+    _USERS_FH.write(field.encode("ascii"))
+    entry["balance"] = new_balance
 
 #Trnscation and record
-def add_transaction(username: str, tx_type: str, amount: Decimal, balance: Decimal, details: str = ""):
-    amount = _normalize_decimal(amount)
-    balance = _normalize_decimal(balance)
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with TRANSACTIONS_FILE.open(mode="a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([username, timestamp, tx_type, f"{amount:.2f}", f"{balance:.2f}", details])
+def add_transaction(username: str, tx_type: str, amount: int, balance: int, details: str = ""):
+    _write_transactions([(username, tx_type, amount, balance, details)])
+
+
+def _write_transactions(records: list[tuple[str, str, int, int, str]]):
+    """Append several (username, type, amount, balance, details) rows in one write."""
+    timestamp = _timestamp()
+    lines = [
+        _csv_line([username, timestamp, tx_type, _format_cents(amount), _format_cents(balance), details])
+        for username, tx_type, amount, balance, details in records
+    ]
+    # Offsets come from the file's current size rather than our own position,
+    # so rows appended by another instance since we opened the file are counted.
+    offset = os.fstat(_TX_FH.fileno()).st_size
+    _TX_FH.write(b"".join(lines))
+    for record, line in zip(records, lines):
+        _TX_OFFSETS.setdefault(record[0], []).append(offset)
+        offset += len(line)
+
+
+def _timestamp() -> str:
+    """Current local time as text, formatted at most once per second."""
+    global _TS_SEC, _TS_TEXT
+    sec = int(time.time())
+    if sec != _TS_SEC:
+        _TS_TEXT = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _TS_SEC = sec
+    return _TS_TEXT
+
+
+def _apply_transfer(sender: str, recipient: str, amount: int) -> int:
+    """Move money between two users and record both sides.
+    Restores both balances if any step fails. Returns the sender's new balance."""
+    sender_balance = get_balance(sender)
+    recipient_balance = get_balance(recipient)
+    try:
+        update_balance(recipient, recipient_balance + amount)
+        update_balance(sender, sender_balance - amount)
+        _write_transactions([
+            (sender, "TRANSFER OUT", amount, sender_balance - amount, f"To {recipient}"),
+            (recipient, "TRANSFER IN", amount, recipient_balance + amount, f"From {sender}"),
+        ])
+    except Exception:
+        update_balance(recipient, recipient_balance)
+        update_balance(sender, sender_balance)
+        raise
+    return sender_balance - amount
 
 #Input amount
 MAX_AMOUNT = Decimal("100000.00")
-def _input_amount(prompt: str) -> Decimal | None:
-    raw = input(prompt).strip()
+_MAX_AMOUNT_TEXT = f"{MAX_AMOUNT:.2f}"
+def _input_amount(prompt: str) -> int | None:
+    """Read a positive amount from the user and return it in cents."""
+    raw = _input(prompt).strip()
     try:
         amount = Decimal(raw)
     except InvalidOperation:
@@ -141,28 +441,50 @@ def _input_amount(prompt: str) -> Decimal | None:
         print("Amount must be greater than zero.")
         return None
     if amount > MAX_AMOUNT:
-        print(f"Amount must be less than {MAX_AMOUNT:.2f}.")
+        print(f"Amount must be less than {_MAX_AMOUNT_TEXT}.")
         return None
     try:
-        return _normalize_decimal(amount)
+        return int(_normalize_decimal(amount) * 100)
     except InvalidOperation:
         print("Amount is too large or invalid.")
         return None
 
 
 # User Interaction Menu
+# Where prompts read their answers from; main() switches to _piped_input
+# when the program is started with --batch.
+_input = input
+_PIPED_LINES = iter(())
+
+
+def _piped_input(prompt: str) -> str:
+    """Like input(), but answers from lines of stdin that were read in one go."""
+    sys.stdout.write(prompt)
+    try:
+        return next(_PIPED_LINES)
+    except StopIteration:
+        raise EOFError from None
+
+
+def _use_piped_input():
+    """Read all of stdin at once instead of one line per prompt (for scripted runs)."""
+    global _input, _PIPED_LINES
+    _PIPED_LINES = iter(sys.stdin.read().splitlines())
+    _input = _piped_input
+
+
 def _repeat_or_back(label: str, allow_repeat: bool = True) -> bool:
     """Ask the user if they want to repeat the same action or go back.
     Returns True if the user wants to repeat, False to go back."""
     while True:
         if allow_repeat:
-            choice = input(f"Press Enter to {label} again or 'b' to go back: ").strip().lower()
+            choice = _input(f"Press Enter to {label} again or 'b' to go back: ").strip().lower()
             if choice == "":
                 return True
             if choice == "b":
                 return False
         else:
-            choice = input("Press 'b' then Enter to go back: ").strip().lower()
+            choice = _input("Press 'b' then Enter to go back: ").strip().lower()
             if choice == "b" or choice == "":
                 return False
         print("Invalid option.")
@@ -179,9 +501,16 @@ def deposit(current_user: str):
             continue
 
         balance = get_balance(current_user) + amount
+        if balance > _MAX_BALANCE:
+            print(f"Balance cannot exceed {_format_cents(_MAX_BALANCE)}.")
+            if not _repeat_or_back("deposit"):
+                return
+            continue
+
         update_balance(current_user, balance)
         add_transaction(current_user, "DEPOSIT", amount, balance, "Cash deposit")
-        print(f"Deposited {amount:.2f}. New balance: {balance:.2f}.")
+        _flush_files()
+        print(f"Deposited {_format_cents(amount)}. New balance: {_format_cents(balance)}.")
 
         if not _repeat_or_back("deposit"):
             return
@@ -206,7 +535,8 @@ def withdraw(current_user: str):
         balance -= amount
         update_balance(current_user, balance)
         add_transaction(current_user, "WITHDRAW", amount, balance, "Cash withdrawal")
-        print(f"Withdrew {amount:.2f}. New balance: {balance:.2f}.")
+        _flush_files()
+        print(f"Withdrew {_format_cents(amount)}. New balance: {_format_cents(balance)}.")
 
         if not _repeat_or_back("withdraw"):
             return
@@ -215,7 +545,7 @@ def withdraw(current_user: str):
 def transfer(current_user: str):
     while True:
         print("\n=== Transfer ===")
-        recipient = input("Enter recipient username: ").strip()
+        recipient = _input("Enter recipient username: ").strip()
         
         # Check if recipient is the same as sender
         if recipient == current_user:
@@ -246,24 +576,15 @@ def transfer(current_user: str):
                 return
             continue
 
-        # Get recipient's current balance
-        recipient_balance = get_balance(recipient)
-
-        # Update balances
+        # Update both balances and record the transfer
         try:
-            # First update recipient's balance (in case of any issues)
-            update_balance(recipient, recipient_balance + amount)
-            # Then update sender's balance
-            update_balance(current_user, sender_balance - amount)
-            
-            # Record transactions
-            add_transaction(current_user, "TRANSFER OUT", amount, sender_balance - amount, f"To {recipient}")
-            add_transaction(recipient, "TRANSFER IN", amount, recipient_balance + amount, f"From {current_user}")
-            
+            new_balance = _apply_transfer(current_user, recipient, amount)
+            _flush_files()
+
             print(f"\nTransfer successful!")
-            print(f"Transferred: ${amount:.2f}")
+            print(f"Transferred: ${_format_cents(amount)}")
             print(f"To: {recipient}")
-            print(f"Your new balance: ${(sender_balance - amount):.2f}")
+            print(f"Your new balance: ${_format_cents(new_balance)}")
             
         except Exception as e:
             print(f"An error occurred during transfer: {str(e)}")
@@ -275,33 +596,46 @@ def transfer(current_user: str):
 #Check balance
 def check_balance(current_user: str):
     balance = get_balance(current_user)
-    print(f"\nCurrent balance: {balance:.2f}")
+    print(f"\nCurrent balance: {_format_cents(balance)}")
     _repeat_or_back("check balance", allow_repeat=False)
 
 #Transaction history
 def transaction_history(current_user: str):
     print("\n=== Transaction History ===")
-    if not TRANSACTIONS_FILE.exists():
+    mm = _tx_map()
+    if mm is None:
         print("No transactions found.")
         return
 
-    with TRANSACTIONS_FILE.open(mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        records = [row for row in reader if row["username"] == current_user]
+    lines = []
+    for offset in _TX_OFFSETS.get(current_user, []):
+        end = mm.find(b"\n", offset)
+        lines.append(mm[offset:end if end != -1 else len(mm)].decode("utf-8"))
+    records = [row for row in map(_split_line, lines) if len(row) > _T_DET]
 
     if not records:
         print("No transactions found.")
         return
 
-    print(f"{'Date':19} | {'Type':12} | {'Amount':10} | {'Balance':10} | Details")
-    print("-" * 70)
-    for row in records:
-        print(f"{row['date']:19} | {row['type']:12} | {row['amount']:10} | {row['balance']:10} | {row['details']}")
+    output = [f"{'Date':19} | {'Type':12} | {'Amount':10} | {'Balance':10} | Details", "-" * 70]
+    output.extend(
+        f"{row[_T_DATE]:19} | {row[_T_TYPE]:12} | {row[_T_AMT]:10} | {row[_T_BAL]:10} | {row[_T_DET]}"
+        for row in records
+    )
+    sys.stdout.write("\n".join(output) + "\n")
 
     _repeat_or_back("view transactions", allow_repeat=False)
 
 
 # Main Menu for user to choose the operation
+_MENU = {
+    "1": deposit,
+    "2": withdraw,
+    "3": transfer,
+    "4": check_balance,
+    "5": transaction_history,
+}
+
 def main_menu(mel_user: str):
     while True:
         print("\n=== Mel Banking System ====")
@@ -312,18 +646,11 @@ def main_menu(mel_user: str):
         print("5. Transaction History")
         print("6. Logout")
 
-        choice = input("Choose an option (1-6): ").strip()
+        choice = _input("Choose an option (1-6): ").strip()
 
-        if choice == "1":
-            deposit(mel_user)
-        elif choice == "2":
-            withdraw(mel_user)
-        elif choice == "3":
-            transfer(mel_user)
-        elif choice == "4":
-            check_balance(mel_user)
-        elif choice == "5":
-            transaction_history(mel_user)
+        action = _MENU.get(choice)
+        if action:
+            action(mel_user)
         elif choice == "6":
             print("Logging out...\n")
             break
@@ -331,21 +658,31 @@ def main_menu(mel_user: str):
             print("Invalid option. Please choose 1-6.")
 
 
+def _login_to_menu():
+    user = login()
+    if user:
+        main_menu(user)
+
+
+_START_MENU = {
+    "1": register,
+    "2": _login_to_menu,
+}
+
 def main():
     initialize_files()
+    if "--batch" in sys.argv[1:]:
+        _use_piped_input()
     while True:
         print("\n=== Mel Banking System ===")
         print("1. Register")
         print("2. Login")
         print("3. Exit")
-        choice = input("Choose an option (1-3): ").strip()
-
-        if choice == "1":
-            register()
-        elif choice == "2":
-            user = login()
-            if user:
-                main_menu(user)
+        choice = _input("Choose an option (1-3): ").strip()
+
+        action = _START_MENU.get(choice)
+        if action:
+            action()
         elif choice == "3":
             print("Goodbye!")
             break